@@ -1,203 +1,258 @@
-import math
+import re
+import bisect
 import logging
+import functools
+import itertools
+from collections import namedtuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for batch scoring
+    np = None  # type: ignore[assignment]
+
+_LOGGER = logging.getLogger(__name__)
+
+# Immutable scores shared between callers through the score cache
+_Score = namedtuple('_Score', 'base temporal severity impact exploit')
+
+# CVSS v3.1 Metric Value Constants
+_AV = {'N': 0.85, 'A': 0.62, 'L': 0.55, 'P': 0.2}  # Attack Vector
+_AC = {'L': 0.77, 'H': 0.44}  # Attack Complexity
+_PR_U = {'N': 0.85, 'L': 0.62, 'H': 0.27}  # Privilege Required, unchanged scope
+_PR_C = {'N': 0.85, 'L': 0.68, 'H': 0.50}  # Privilege Required, changed scope
+_UI = {'N': 0.85, 'R': 0.62}  # User Interaction
+_CIA = {'H': 0.56, 'L': 0.22, 'N': 0.0}  # Impact metrics (C, I, A)
+
+# CVSS v3.1 Temporal Metric Value Constants
+_E = {'X': 1.0, 'H': 1.0, 'F': 0.97, 'P': 0.94, 'U': 0.91}  # Exploit Code Maturity
+_RL = {'X': 1.0, 'O': 0.95, 'T': 0.96, 'W': 0.97, 'U': 1.0}  # Remediation Level
+_RC = {'X': 1.0, 'C': 1.0, 'R': 0.96, 'U': 0.92}  # Report Confidence
+
+# Valid values of the eight base metrics, in vector order
+_BASE_VALUES = {
+    'AV': 'NALP', 'AC': 'LH', 'PR': 'NLH', 'UI': 'NR',
+    'S': 'UC', 'C': 'HLN', 'I': 'HLN', 'A': 'HLN'
+}
+
+# Qualitative severity: lower bound of each rating after "None" (scores carry one decimal)
+_SEVERITY_THRESHOLDS = (0.1, 4.0, 7.0, 9.0)
+_SEVERITY_LABELS = ("None", "Low", "Medium", "High", "Critical")
+
+# Vector parsing: one "/KEY:VALUE" token per match (the CVSS:3.1 prefix never matches)
+_TOKEN_RE = re.compile(r'(?:^|/)([A-Z]{1,3}):([A-Z])(?=/|\Z)')
+# One bit per base and temporal metric, set by parse_vector for each metric present
+_BIT = {
+    'AV': 1, 'AC': 2, 'PR': 4, 'UI': 8, 'S': 16, 'C': 32, 'I': 64, 'A': 128,
+    'E': 256, 'RL': 512, 'RC': 1024
+}
+_REQUIRED_MASK = 0xFF
+_TEMPORAL_BITS = _BIT['E'] | _BIT['RL'] | _BIT['RC']
+# Whole-vector validation (used with fullmatch): CVSS:3.1 prefix, every base metric
+# present, only known base, temporal and environmental values, optional trailing '/'
+_VALID_RE = re.compile(
+    r'CVSS:3\.1'
+    r'(?=.*/AV:)(?=.*/AC:)(?=.*/PR:)(?=.*/UI:)(?=.*/S:)(?=.*/C:)(?=.*/I:)(?=.*/A:)'
+    r'(?:/AV:[NALP]|/AC:[LH]|/PR:[NLH]|/UI:[NR]|/S:[UC]|/[CIA]:[HLN]'
+    r'|/E:[XHFPU]|/RL:[XOTWU]|/RC:[XCRU]'
+    r'|/[CIA]R:[XLMH]|/MAV:[XNALP]|/MAC:[XLH]|/MPR:[XNLH]|/MUI:[XNR]|/MS:[XUC]|/M[CIA]:[XHLN])+/?'
+)
 
 class CVSSCalculator:
-    # CVSS v3.1 Metric Value Constants
-    METRICS = {
-        'AV': {'N': 0.85, 'A': 0.62, 'L': 0.55, 'P': 0.2},  # Attack Vector
-        'AC': {'L': 0.77, 'H': 0.44},  # Attack Complexity
-        'PR': {  # Privilege Required
-            'N': {'U': 0.85, 'C': 0.85},  # Unchanged scope
-            'L': {'U': 0.62, 'C': 0.68},  # Changed scope
-            'H': {'U': 0.27, 'C': 0.50}
-        },
-        'UI': {'N': 0.85, 'R': 0.62},  # User Interaction
-        'CIA': {'H': 0.56, 'L': 0.22, 'N': 0},  # Impact metrics (C, I, A)
-    }
-
-    def __init__(self):
-        self.logger = logging.getLogger(__name__)
+    __slots__ = ()
 
     @staticmethod
-    def round_up(number):
-        """Round up to 1 decimal place"""
-        return math.ceil(number * 10) / 10
+    def round_up(number: float) -> float:
+        """Round up to 1 decimal place (CVSS v3.1 spec Roundup, immune to float residue)"""
+        int_input = int(number * 100000 + 0.5)
+        return (-(-int_input // 10000)) / 10
 
-    def calculate_score(self, vector_string):
+    def calculate_score(self, vector_string: str) -> Dict[str, Any]:
         """Main method to calculate CVSS scores"""
         try:
-            # Calculate base score
-            base_score = self.calculate_base_score(vector_string)
-            
-            # Get severity rating
-            severity = self.get_severity(base_score)
-            
-            # Calculate temporal score if temporal metrics present
-            metrics = self.parse_vector(vector_string)
-            temporal_score = None
-            if any(m in metrics for m in ['E', 'RL', 'RC']):
-                temporal_score = self.calculate_temporal_score(base_score, metrics)
+            score = _score_cached(_cache_key(vector_string))
             
             return {
                 'vector_string': vector_string,
-                'base_score': base_score,
-                'temporal_score': temporal_score,
-                'severity': severity,
-                'impact_score': self.last_impact_score,
-                'exploitability_score': self.last_exploitability_score
+                'base_score': score.base,
+                'temporal_score': score.temporal,
+                'severity': score.severity,
+                'impact_score': score.impact,
+                'exploitability_score': score.exploit
             }
             
         except Exception as e:
-            self.logger.error(f"Error calculating CVSS score: {str(e)}")
+            _LOGGER.error("Error calculating CVSS score: %s", e)
             return {
                 'error': f"Error calculating CVSS score: {str(e)}",
                 'vector_string': vector_string
             }
 
-    def calculate_base_score(self, vector_string):
-        """Calculate CVSS Base Score from vector string"""
-        metrics = self.parse_vector(vector_string)
-        
+    @classmethod
+    def calculate_many(cls, vectors: Sequence[str]) -> 'np.ndarray':
+        """Calculate CVSS Base Scores for many vector strings as a NumPy array"""
+        if np is None:
+            raise ImportError("calculate_many requires NumPy")
+
+        # Encode the eight base metric values of every vector as one uint8 row
+        chars: List[str] = []
+        for vector_string in vectors:
+            metrics, _ = cls.parse_vector(vector_string)
+            chars.extend(metrics[key] for key in _BASE_VALUES)
+        codes = np.frombuffer(''.join(chars).encode('ascii'), dtype=np.uint8).reshape(-1, len(_BASE_VALUES))
+
+        # Map characters to value indexes in one gather; unknown values map to _NP_INVALID
+        index = _NP_INDEX[np.arange(len(_BASE_VALUES)), codes]
+        invalid = (index == _NP_INVALID).any(axis=1)
+        if invalid.any():
+            raise ValueError(f"Invalid base metric values in vector: {vectors[int(np.argmax(invalid))]}")
+
+        # Same formulas as the scalar path, evaluated column-wise
+        changed = index[:, 4] == _BASE_VALUES['S'].index('C')
+        pr = np.where(changed, _NP_PR_C[index[:, 2]], _NP_PR_U[index[:, 2]])
+        exploit_sub = 8.22 * _NP_AV[index[:, 0]] * _NP_AC[index[:, 1]] * pr * _NP_UI[index[:, 3]]
+
+        isc_base = 1 - ((1 - _NP_CIA[index[:, 5]]) * (1 - _NP_CIA[index[:, 6]]) * (1 - _NP_CIA[index[:, 7]]))
+        t = isc_base - 0.02
+        t2 = t * t
+        t4 = t2 * t2
+        t8 = t4 * t4
+        impact_sub = np.where(
+            changed,
+            7.52 * (isc_base - 0.029) - 3.25 * (t8 * t4 * t2 * t),
+            6.42 * isc_base
+        )
+
+        total = np.where(changed, 1.08 * (impact_sub + exploit_sub), impact_sub + exploit_sub)
+        int_input = np.floor(np.minimum(total, 10.0) * 100000 + 0.5).astype(np.int64)
+        base_score = (-(-int_input // 10000)) / 10
+        return np.where(impact_sub <= 0, 0.0, base_score)
+
+    def calculate_base_score(self, vector_string: str) -> Tuple[float, float, float]:
+        """Calculate CVSS (base, impact, exploitability) scores from vector string"""
+        metrics, _ = self.parse_vector(vector_string)
+        return self._base_scores(metrics)
+
+    @staticmethod
+    def _base_scores(metrics: Dict[str, str]) -> Tuple[float, float, float]:
+        """Look up (base, impact, exploitability) scores for parsed metrics"""
+        key = (metrics['AV'], metrics['AC'], metrics['PR'], metrics['UI'],
+               metrics['S'], metrics['C'], metrics['I'], metrics['A'])
+        scores = _BASE_TABLE.get(key)
+        if scores is None:
+            raise ValueError(f"Invalid base metric values: {'/'.join(key)}")
+        return scores
+
+    @staticmethod
+    def _compute_base_scores(metrics: Dict[str, str]) -> Tuple[float, float, float]:
+        """Calculate (base, impact, exploitability) scores from parsed metrics"""
         # Calculate Impact Sub Score (ISC)
-        isc_base = self.calculate_isc_base(metrics)
-        impact_sub = self.calculate_impact_sub(isc_base, metrics['S'])
-        self.last_impact_score = impact_sub
+        isc_base = CVSSCalculator.calculate_isc_base(metrics)
+        impact_sub = CVSSCalculator.calculate_impact_sub(isc_base, metrics['S'])
         
         # Calculate Exploitability Sub Score
-        exploit_sub = self.calculate_exploitability(metrics)
-        self.last_exploitability_score = exploit_sub
+        exploit_sub = CVSSCalculator.calculate_exploitability(metrics)
         
         # Calculate Base Score
         if impact_sub <= 0:
-            return 0.0
+            return 0.0, impact_sub, exploit_sub
         else:
             if metrics['S'] == 'U':  # Scope Unchanged
-                return self.round_up(min((impact_sub + exploit_sub), 10.0))
+                base_score = CVSSCalculator.round_up(min((impact_sub + exploit_sub), 10.0))
             else:  # Scope Changed
-                return self.round_up(min((1.08 * (impact_sub + exploit_sub)), 10.0))
+                base_score = CVSSCalculator.round_up(min((1.08 * (impact_sub + exploit_sub)), 10.0))
+            return base_score, impact_sub, exploit_sub
 
-    def parse_vector(self, vector_string):
-        """Parse CVSS v3.1 vector string into dictionary"""
-        try:
-            if vector_string.startswith('CVSS:3.1/'):
-                vector_string = vector_string[9:]
-
-            metrics = {}
-            for metric in vector_string.split('/'):
-                if metric:
-                    key, value = metric.split(':')
-                    metrics[key] = value
-            
-            # Validate required metrics
-            required_metrics = {'AV', 'AC', 'PR', 'UI', 'S', 'C', 'I', 'A'}
-            if not required_metrics.issubset(metrics.keys()):
-                missing = required_metrics - metrics.keys()
-                raise ValueError(f"Missing required metrics: {missing}")
-                
-            return metrics
+    @staticmethod
+    def parse_vector(vector_string: str) -> Tuple[Dict[str, str], int]:
+        """Parse CVSS v3.1 vector string into (metrics dictionary, metric presence bitmask)"""
+        tokens = _TOKEN_RE.findall(vector_string)
+
+        # Every non-empty segment after the CVSS prefix must be a KEY:VALUE token
+        segments = [segment for segment in vector_string.split('/') if segment]
+        if segments and segments[0].startswith('CVSS:'):
+            del segments[0]
+        if len(tokens) != len(segments):
+            bad = next(segment for segment in segments if not _TOKEN_RE.fullmatch(segment))
+            raise ValueError(f"Invalid vector string format: Malformed metric: {bad!r}")
+        metrics = dict(tokens)
+
+        # Validate required metrics
+        mask = 0
+        for key in metrics:
+            mask |= _BIT.get(key, 0)
+        if (mask & _REQUIRED_MASK) != _REQUIRED_MASK:
+            missing = {key for key, bit in _BIT.items() if bit & _REQUIRED_MASK and not mask & bit}
+            raise ValueError(f"Invalid vector string format: Missing required metrics: {missing}")
             
-        except Exception as e:
-            raise ValueError(f"Invalid vector string format: {str(e)}")
+        return metrics, mask
 
-    def calculate_isc_base(self, metrics):
+    @staticmethod
+    def calculate_isc_base(metrics: Dict[str, str]) -> float:
         """Calculate ISCBase"""
-        try:
-            impact_conf = self.METRICS['CIA'][metrics['C']]
-            impact_integ = self.METRICS['CIA'][metrics['I']]
-            impact_avail = self.METRICS['CIA'][metrics['A']]
-            
-            isc_base = 1 - ((1 - impact_conf) * (1 - impact_integ) * (1 - impact_avail))
-            return isc_base
-            
-        except KeyError as e:
-            raise ValueError(f"Invalid impact metric value: {str(e)}")
+        impact_conf = _CIA[metrics['C']]
+        impact_integ = _CIA[metrics['I']]
+        impact_avail = _CIA[metrics['A']]
+        
+        return 1 - ((1 - impact_conf) * (1 - impact_integ) * (1 - impact_avail))
 
-    def calculate_impact_sub(self, isc_base, scope):
+    @staticmethod
+    def calculate_impact_sub(isc_base: float, scope: str) -> float:
         """Calculate Impact sub score"""
-        try:
-            if scope == 'U':  # Unchanged
-                return 6.42 * isc_base
-            else:  # Changed
-                return 7.52 * (isc_base - 0.029) - 3.25 * pow((isc_base - 0.02), 15)
-                
-        except Exception as e:
-            raise ValueError(f"Error calculating impact sub score: {str(e)}")
+        if scope == 'U':  # Unchanged
+            return 6.42 * isc_base
+        else:  # Changed
+            # (isc_base - 0.02) ** 15 by repeated squaring
+            t = isc_base - 0.02
+            t2 = t * t
+            t4 = t2 * t2
+            t8 = t4 * t4
+            return 7.52 * (isc_base - 0.029) - 3.25 * (t8 * t4 * t2 * t)
 
-    def calculate_exploitability(self, metrics):
+    @staticmethod
+    def calculate_exploitability(metrics: Dict[str, str]) -> float:
         """Calculate Exploitability sub score"""
-        try:
-            attack_vector = self.METRICS['AV'][metrics['AV']]
-            attack_complexity = self.METRICS['AC'][metrics['AC']]
-            privilege_required = self.METRICS['PR'][metrics['PR']][metrics['S']]
-            user_interaction = self.METRICS['UI'][metrics['UI']]
-            
-            return 8.22 * attack_vector * attack_complexity * privilege_required * user_interaction
-            
-        except KeyError as e:
-            raise ValueError(f"Invalid exploitability metric value: {str(e)}")
+        pr_table = _PR_C if metrics['S'] == 'C' else _PR_U
+        return 8.22 * _AV[metrics['AV']] * _AC[metrics['AC']] * pr_table[metrics['PR']] * _UI[metrics['UI']]
 
-    def calculate_temporal_score(self, base_score, metrics):
+    @staticmethod
+    def calculate_temporal_score(base_score: float, metrics: Dict[str, str]) -> Optional[float]:
         """Calculate CVSS Temporal Score"""
         try:
             # Get temporal metrics with defaults
-            exploit_code = self.get_temporal_value(metrics.get('E', 'X'))
-            remediation_level = self.get_temporal_value(metrics.get('RL', 'X'))
-            report_confidence = self.get_temporal_value(metrics.get('RC', 'X'))
-            
-            temporal_score = base_score * exploit_code * remediation_level * report_confidence
-            return self.round_up(temporal_score)
+            temporal_score = (base_score * _E[metrics.get('E', 'X')]
+                              * _RL[metrics.get('RL', 'X')] * _RC[metrics.get('RC', 'X')])
+            # Roundup, inlined
+            return (-(-int(temporal_score * 100000 + 0.5) // 10000)) / 10
             
         except Exception as e:
-            self.logger.error(f"Error calculating temporal score: {str(e)}")
+            _LOGGER.error("Error calculating temporal score: %s", e)
             return None
 
     @staticmethod
-    def get_temporal_value(metric):
-        """Get values for temporal metrics"""
-        temporal_values = {
-            # Exploit Code Maturity (E)
-            'X': 1.0, 'H': 1.0, 'F': 0.97, 'P': 0.94, 'U': 0.91,
-            # Remediation Level (RL)
-            'O': 0.95, 'T': 0.96, 'W': 0.97, 'U': 1.0,
-            # Report Confidence (RC)
-            'C': 1.0, 'R': 0.96, 'U': 0.92
-        }
-        return temporal_values.get(metric, 1.0)
-
-    @staticmethod
-    def get_severity(score):
+    def get_severity(score: float) -> str:
         """Get qualitative severity rating"""
-        if score == 0:
-            return "None"
-        elif score < 4.0:
-            return "Low"
-        elif score < 7.0:
-            return "Medium"
-        elif score < 9.0:
-            return "High"
-        else:
-            return "Critical"
+        return _SEVERITY_LABELS[bisect.bisect_right(_SEVERITY_THRESHOLDS, score)]
 
-    def validate_vector_string(self, vector_string):
+    def validate_vector_string(self, vector_string: str) -> bool:
         """Validate CVSS vector string format"""
+        if isinstance(vector_string, str) and _VALID_RE.fullmatch(vector_string):
+            return True
+        
+        # Re-check step by step only to report why validation failed
         try:
-            # Check prefix
             if not vector_string.startswith('CVSS:3.1/'):
                 raise ValueError("Vector string must start with 'CVSS:3.1/'")
-            
-            # Parse and validate metrics
-            metrics = self.parse_vector(vector_string)
-            
-            # Validate metric values
-            self.validate_metric_values(metrics)
-            
-            return True
-            
+            self.validate_metric_values(self.parse_vector(vector_string)[0])
+            reason = "Unsupported or malformed metric"
         except Exception as e:
-            self.logger.error(f"Vector string validation failed: {str(e)}")
-            return False
+            reason = str(e)
+        
+        _LOGGER.error("Vector string validation failed: %s", reason)
+        return False
 
-    def validate_metric_values(self, metrics):
+    @staticmethod
+    def validate_metric_values(metrics: Dict[str, str]) -> None:
         """Validate individual metric values"""
         valid_values = {
             'AV': ['N', 'A', 'L', 'P'],
@@ -214,6 +269,63 @@ class CVSSCalculator:
             if metric in valid_values and value not in valid_values[metric]:
                 raise ValueError(f"Invalid value '{value}' for metric '{metric}'")
 
+def score_vector(vector_string: str) -> float:
+    """Fast path: return only the Base Score, without building a result dict or catching errors"""
+    base: float = _score_cached(_cache_key(vector_string)).base
+    return base
+
+def _cache_key(vector_string: str) -> str:
+    """Normalize a vector string so equivalent vectors share one cache slot"""
+    if vector_string.startswith('CVSS:3.1/'):
+        vector_string = vector_string[9:]
+    # Token order is kept: when a metric repeats, its last occurrence wins
+    return '/'.join(metric for metric in vector_string.split('/') if metric)
+
+@functools.lru_cache(maxsize=65536)
+def _score_cached(cache_key: str) -> _Score:
+    """Calculate all scores for a normalized vector string, memoized"""
+    metrics, mask = CVSSCalculator.parse_vector(cache_key)
+    base_score, impact_score, exploitability_score = CVSSCalculator._base_scores(metrics)
+    
+    # Calculate temporal score if temporal metrics present
+    temporal_score = None
+    if mask & _TEMPORAL_BITS:
+        temporal_score = CVSSCalculator.calculate_temporal_score(base_score, metrics)
+    
+    return _Score(
+        base_score,
+        temporal_score,
+        CVSSCalculator.get_severity(base_score),
+        impact_score,
+        exploitability_score
+    )
+
+def _build_base_table() -> Dict[Tuple[str, ...], Tuple[float, float, float]]:
+    """Precompute (base, impact, exploitability) for every base metric combination"""
+    table = {}
+    for values in itertools.product(*_BASE_VALUES.values()):
+        metrics = dict(zip(_BASE_VALUES, values))
+        table[values] = CVSSCalculator._compute_base_scores(metrics)
+    return table
+
+# Base scores depend only on the eight base metrics, so score them all once
+_BASE_TABLE = _build_base_table()
+
+if np is not None:
+    # calculate_many: per-metric 256-entry map from value character to value index
+    _NP_INVALID = 255
+    _NP_INDEX = np.full((len(_BASE_VALUES), 256), _NP_INVALID, dtype=np.uint8)
+    for _col, _values in enumerate(_BASE_VALUES.values()):
+        _NP_INDEX[_col, [ord(value) for value in _values]] = range(len(_values))
+
+    # Weights indexed by value index, in _BASE_VALUES order
+    _NP_AV = np.array([_AV[value] for value in _BASE_VALUES['AV']])
+    _NP_AC = np.array([_AC[value] for value in _BASE_VALUES['AC']])
+    _NP_PR_U = np.array([_PR_U[value] for value in _BASE_VALUES['PR']])
+    _NP_PR_C = np.array([_PR_C[value] for value in _BASE_VALUES['PR']])
+    _NP_UI = np.array([_UI[value] for value in _BASE_VALUES['UI']])
+    _NP_CIA = np.array([_CIA[value] for value in _BASE_VALUES['C']], dtype=float)
+
 if __name__ == "__main__":
     # Test the calculator
     calculator = CVSSCalculator()
@@ -233,5 +345,5 @@ if __name__ == "__main__":
             print(f"Severity: {result['severity']}")
             print(f"Impact Score: {result['impact_score']}")
             print(f"Exploitability Score: {result['exploitability_score']}")
-            if result['temporal_score']:
+            if result['temporal_score'] is not None:
                 print(f"Temporal Score: {result['temporal_score']}")
\ No newline at end of file
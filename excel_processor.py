@@ -1,10 +1,31 @@
 import openpyxl
 import logging
-from datetime import datetime
+import re
+import zipfile
+from datetime import date, datetime, time
 import os
 from pathlib import Path
+from cvss_calculator import CVSSCalculator
+
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # python-calamine is optional; openpyxl reads the input otherwise
+    CalamineWorkbook = None
+
+# A formula element in worksheet XML, with or without a namespace prefix
+_FORMULA_RE = re.compile(rb'<(?:\w+:)?f[\s/>]')
 
 class ExcelProcessor:
+    # One result column per base metric, in vector order
+    METRIC_HEADERS = {
+        'AV': 'Attack Vector', 'AC': 'Attack Complexity', 'PR': 'Privileges Required',
+        'UI': 'User Interaction', 'S': 'Scope', 'C': 'Confidentiality',
+        'I': 'Integrity', 'A': 'Availability'
+    }
+    RESULT_HEADERS = [
+        'CVSS Vector', 'Base Score', 'Severity', 'Temporal Score', 'Environmental Score'
+    ] + list(METRIC_HEADERS.values())
+
     def __init__(self, input_file, gui=None):
         self.input_file = input_file
         self.gui = gui
@@ -25,11 +46,11 @@ class ExcelProcessor:
         try:
             # Load workbook
             self.log_progress("Loading workbook...", 10)
-            self.wb = openpyxl.load_workbook(self.input_file)
-            self.sheet = self.wb.active
+            sheet_title, rows = self.read_rows()
 
             # Get headers
-            headers = [str(cell.value).strip() if cell.value else "" for cell in self.sheet[1]]
+            header_row = list(next(rows, ()))
+            headers = [str(value).strip() if value else "" for value in header_row]
             self.log_progress(f"Found columns: {headers}", 20)
 
             # Identify threat description column
@@ -37,24 +58,35 @@ class ExcelProcessor:
             if not threat_col:
                 raise ValueError(f"Could not identify threat column. Available columns: {headers}")
 
-            # Create output file
+            # Create output file, written row by row in write-only mode
             self.create_output_file()
+            out_wb = openpyxl.Workbook(write_only=True)
+            out_sheet = self.create_output_sheets(out_wb, sheet_title)
 
             # Add result columns
-            start_col = len(headers) + 1
-            self.add_result_columns(start_col)
+            out_sheet.append(header_row + self.RESULT_HEADERS)
+
+            # Read every row first so the descriptions can be batched through spaCy;
+            # keep the original cells and line the results up after the header columns
+            table = [list(values[:len(headers)]) + [None] * (len(headers) - len(values)) for values in rows]
 
             # Process each row
-            total_rows = self.sheet.max_row - 1  # Excluding header
+            total_rows = len(table)  # Excluding header
             successful = 0
             failed = 0
 
-            for row in range(2, self.sheet.max_row + 1):
+            # Run spaCy over all threat descriptions in batches, one vector per threat row
+            vectors = vector_generator.generate_vectors(
+                [cells[threat_col - 1] for cells in table if cells[threat_col - 1]]
+            )
+
+            for row, cells in enumerate(table, 2):
                 # Calculate progress percentage
-                progress = 20 + (row - 1) / (self.sheet.max_row - 1) * 70
+                progress = 20 + (row - 1) / total_rows * 70
                 
-                threat_desc = self.sheet.cell(row=row, column=threat_col).value
+                threat_desc = cells[threat_col - 1]
                 if not threat_desc:
+                    out_sheet.append(cells)
                     continue
 
                 self.log_progress(f"Processing row {row-1}/{total_rows}", progress)
@@ -62,22 +94,26 @@ class ExcelProcessor:
 
                 try:
                     # Generate CVSS vector
-                    vector = vector_generator.generate_vector(threat_desc)
+                    vector = next(vectors)
                     if vector:
                         # Calculate CVSS score
                         result = cvss_calculator.calculate_score(vector)
-                        self.save_results(row, start_col, result)
-                        successful += 1
+                        cells += self.save_results(row, result)
+                        if 'error' in result:
+                            failed += 1
+                        else:
+                            successful += 1
                     else:
-                        self.sheet.cell(row=row, column=start_col + 4, value="Could not generate vector")
+                        cells += [None, None, None, None, "Could not generate vector"]
                         failed += 1
                 except Exception as e:
                     self.log_progress(f"Error processing row {row}: {str(e)}")
                     failed += 1
+                out_sheet.append(cells)
 
             # Save workbook
             self.log_progress("Saving results...", 90)
-            self.wb.save(self.output_file)
+            out_wb.save(self.output_file)
 
             # Final summary
             summary = f"""
@@ -96,6 +132,72 @@ class ExcelProcessor:
             self.log_progress(error_msg)
             raise
 
+        finally:
+            # Read-only workbooks keep the file open until closed
+            if self.wb is not None:
+                self.wb.close()
+
+    def read_rows(self):
+        """Return the input sheet's title and an iterator over its row values"""
+        # Read-only mode streams rows instead of building every cell up front; formulas
+        # are read as written so they are copied to the output unchanged
+        self.wb = openpyxl.load_workbook(self.input_file, read_only=True, data_only=False)
+        self.sheet = self.wb.active
+
+        if CalamineWorkbook is not None and not self.has_formulas(self.sheet):
+            # Native reader, much faster than openpyxl; it only sees cached formula
+            # values, so it is used for the active sheet when that has no formulas
+            with CalamineWorkbook.from_path(self.input_file) as workbook:
+                rows = workbook.get_sheet_by_name(self.sheet.title).to_python(skip_empty_area=False)
+            return self.sheet.title, ([self.calamine_value(value) for value in row] for row in rows)
+
+        return self.sheet.title, self.sheet.iter_rows(values_only=True)
+
+    def has_formulas(self, sheet):
+        """Check whether a read-only sheet's XML contains any formula"""
+        with zipfile.ZipFile(self.input_file) as archive, archive.open(sheet._worksheet_path) as part:
+            tail = b''
+            for chunk in iter(lambda: part.read(1 << 20), b''):
+                # Keep a few bytes so a tag split across chunks is still found
+                data = tail + chunk
+                if _FORMULA_RE.search(data):
+                    return True
+                tail = data[-16:]
+        return False
+
+    @staticmethod
+    def calamine_value(value):
+        """Convert a calamine cell value to what openpyxl reads for the same cell"""
+        if isinstance(value, str):
+            # calamine reports empty cells as ''
+            return value or None
+        if isinstance(value, float) and value.is_integer():
+            # calamine reads every number as float, openpyxl keeps whole numbers as int
+            return int(value)
+        if type(value) is date:
+            return datetime.combine(value, time())
+        return value
+
+    def create_output_sheets(self, out_wb, sheet_title):
+        """Recreate the input's sheets in order, copying all but the scored one; returns that one"""
+        out_sheet = None
+        for index, sheet in enumerate(self.wb.worksheets):
+            copy = out_wb.create_sheet(sheet.title)
+            if sheet.title == sheet_title:
+                out_sheet = copy
+                out_wb.active = index
+            else:
+                # Values and formulas only; write-only sheets cannot take cell styles
+                for values in sheet.iter_rows(values_only=True):
+                    copy.append(values)
+
+        if len(self.wb.worksheets) > 1:
+            logging.warning(
+                "Copied %d other sheet(s) to the output; cell formatting is not kept",
+                len(self.wb.worksheets) - 1
+            )
+        return out_sheet
+
     def identify_column(self, headers):
         """Identify threat description column"""
         possible_names = [
@@ -118,50 +220,30 @@ class ExcelProcessor:
         base_name = os.path.basename(self.input_file)
         self.output_file = os.path.join(output_dir, f"cvss_scored_{timestamp}_{base_name}")
 
-    def add_result_columns(self, start_col):
-        """Add result columns to worksheet"""
-        headers = [
-            'CVSS Vector', 'Base Score', 'Severity', 'Temporal Score',
-            'Environmental Score', 'Attack Vector', 'Attack Complexity',
-            'Privileges Required', 'User Interaction', 'Impact Scores'
-        ]
-        
-        for idx, header in enumerate(headers):
-            self.sheet.cell(row=1, column=start_col + idx, value=header)
-
-    def save_results(self, row, start_col, results):
-        """Save calculation results to Excel"""
+    def save_results(self, row, results):
+        """Format calculation results as the row's result cells"""
+        cells = []
         try:
             # Save vector string and scores
-            self.sheet.cell(row=row, column=start_col, value=results['vector_string'])
-            self.sheet.cell(row=row, column=start_col + 1, value=results['base_score'])
-            self.sheet.cell(row=row, column=start_col + 2, value=results['base_severity'])
-            
-            # Save temporal score if available
-            if 'temporal_score' in results and results['temporal_score']:
-                self.sheet.cell(row=row, column=start_col + 3, value=results['temporal_score'])
+            cells.append(results['vector_string'])
+            if 'error' in results:
+                cells += [None, None, None, results['error']]
+                return cells
+            cells += [results['base_score'], results['severity']]
             
-            # Save environmental score if available
-            if 'environmental_score' in results and results['environmental_score']:
-                self.sheet.cell(row=row, column=start_col + 4, value=results['environmental_score'])
+            # Save temporal and environmental scores; None leaves the cell blank
+            cells += [results.get('temporal_score'), results.get('environmental_score')]
             
-            # Save individual metrics if available
+            # Save individual base metrics under their headers
             metrics = self.parse_vector_metrics(results['vector_string'])
-            col_offset = 5
-            for value in metrics.values():
-                self.sheet.cell(row=row, column=start_col + col_offset, value=value)
-                col_offset += 1
+            cells += [metrics.get(metric) for metric in self.METRIC_HEADERS]
 
         except Exception as e:
             self.log_progress(f"Error saving results for row {row}: {str(e)}")
+        return cells
 
     @staticmethod
     def parse_vector_metrics(vector_string):
         """Parse individual metrics from vector string"""
-        metrics = {}
-        parts = vector_string.split('/')
-        for part in parts:
-            if ':' in part:
-                key, value = part.split(':')
-                metrics[key] = value
-        return metrics
\ No newline at end of file
+        # Same tokenizer as the calculator, so both agree on what a metric token is
+        return CVSSCalculator.parse_vector(vector_string)[0]
\ No newline at end of file
@@ -1,6 +1,8 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import logging
+import queue
+import threading
 from excel_processor import ExcelProcessor
 from vector_generator import VectorGenerator
 from cvss_calculator import CVSSCalculator
@@ -19,7 +21,11 @@ class CVSSCalculatorGUI:
         # Set initial directory to current working directory
         self.initial_dir = os.getcwd()
         
+        # Status and progress updates, posted from any thread and applied on the Tk thread
+        self.updates = queue.Queue()
+        
         self.setup_gui()
+        self.root.after(100, self.drain_updates)
 
     def setup_gui(self):
         # Main frame
@@ -126,18 +132,31 @@ class CVSSCalculatorGUI:
             messagebox.showerror("Error", "Selected file does not exist.")
             return
             
+        self.update_status(f"Processing file: {file_path}")
+        self.disable_inputs()
+        
+        # Process the file in the background so the window stays responsive
+        threading.Thread(target=self.process_in_background, args=(file_path,), daemon=True).start()
+
+    def process_in_background(self, file_path):
+        """Run the Excel processing off the Tk thread and post the outcome back to it"""
         try:
-            self.update_status(f"Processing file: {file_path}")
-            self.disable_inputs()
-            
-            # Process the file
             excel_processor = ExcelProcessor(file_path, self)
             result = excel_processor.process_file(
                 self.vector_generator,
                 self.cvss_calculator
             )
-            
-            if result:
+            self.updates.put(('done', result))
+        except Exception as e:
+            logging.error(f"Error processing file: {str(e)}")
+            self.updates.put(('error', e))
+
+    def finish_processing(self, result=None, error=None):
+        """Report the processing outcome and re-enable the inputs"""
+        try:
+            if error is not None:
+                messagebox.showerror("Error", f"An error occurred: {str(error)}")
+            elif result:
                 messagebox.showinfo(
                     "Success",
                     f"Processing complete!\nResults saved to: {result}"
@@ -148,10 +167,6 @@ class CVSSCalculatorGUI:
                     "Failed to process file. Check the status log for details."
                 )
             
-        except Exception as e:
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
-            logging.error(f"Error processing file: {str(e)}")
-            
         finally:
             self.enable_inputs()
             self.update_status("Ready for next file...")
@@ -169,15 +184,30 @@ class CVSSCalculatorGUI:
         self.file_path_entry.config(state='normal')
 
     def update_status(self, message):
-        """Update status text with new message"""
-        self.status_text.insert(tk.END, f"{message}\n")
-        self.status_text.see(tk.END)
-        self.root.update()
+        """Queue a status message; safe to call from the processing thread"""
+        self.updates.put(('status', message))
 
     def update_progress(self, value):
-        """Update progress bar"""
-        self.progress_var.set(value)
-        self.root.update()
+        """Queue a progress bar update; safe to call from the processing thread"""
+        self.updates.put(('progress', value))
+
+    def drain_updates(self):
+        """Apply queued updates on the Tk thread, then check again shortly"""
+        try:
+            while True:
+                kind, value = self.updates.get_nowait()
+                if kind == 'status':
+                    self.status_text.insert(tk.END, f"{value}\n")
+                    self.status_text.see(tk.END)
+                elif kind == 'progress':
+                    self.progress_var.set(value)
+                elif kind == 'done':
+                    self.finish_processing(result=value)
+                elif kind == 'error':
+                    self.finish_processing(error=value)
+        except queue.Empty:
+            pass
+        self.root.after(100, self.drain_updates)
 
     def run(self):
         """Start the GUI application"""
@@ -0,0 +1,98 @@
+import pytest
+
+from cvss_calculator import CVSSCalculator, score_vector
+
+
+@pytest.fixture
+def calculator():
+    return CVSSCalculator()
+
+
+# Base scores from the CVSS v3.1 specification and the NVD calculator
+BASE_VECTORS = [
+    ("CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H", 9.8, "Critical"),
+    ("CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:C/C:H/I:H/A:H", 10.0, "Critical"),
+    ("CVSS:3.1/AV:L/AC:L/PR:L/UI:N/S:U/C:L/I:L/A:L", 5.3, "Medium"),
+    ("CVSS:3.1/AV:N/AC:H/PR:N/UI:R/S:C/C:H/I:H/A:H", 8.3, "High"),
+    ("CVSS:3.1/AV:N/AC:L/PR:N/UI:R/S:C/C:L/I:L/A:N", 6.1, "Medium"),
+    ("CVSS:3.1/AV:P/AC:H/PR:H/UI:R/S:U/C:L/I:N/A:N", 1.6, "Low"),
+    ("CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:N", 0.0, "None"),
+]
+
+
+@pytest.mark.parametrize("vector, base, severity", BASE_VECTORS)
+def test_base_score(calculator, vector, base, severity):
+    result = calculator.calculate_score(vector)
+    assert result['base_score'] == base
+    assert result['severity'] == severity
+    assert result['temporal_score'] is None
+    assert score_vector(vector) == base
+
+
+# Temporal scores use the specification's Roundup, so float residue never
+# rounds a score up by an extra 0.1
+TEMPORAL_VECTORS = [
+    ("CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H/E:U/RL:O/RC:R", 8.2),
+    ("CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H/E:U/RL:O/RC:U", 7.8),
+    ("CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H/RL:U/RC:U", 9.1),
+    ("CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:C/C:H/I:H/A:H/E:H/RL:U/RC:U", 9.2),
+    ("CVSS:3.1/AV:L/AC:L/PR:L/UI:N/S:U/C:L/I:L/A:L/E:F/RL:T/RC:R", 4.8),
+    ("CVSS:3.1/AV:N/AC:L/PR:N/UI:R/S:C/C:L/I:L/A:N/E:P/RL:T/RC:U", 5.1),
+]
+
+
+@pytest.mark.parametrize("vector, temporal", TEMPORAL_VECTORS)
+def test_temporal_score(calculator, vector, temporal):
+    assert calculator.calculate_score(vector)['temporal_score'] == temporal
+
+
+def test_round_up():
+    assert CVSSCalculator.round_up(4.02) == 4.1
+    assert CVSSCalculator.round_up(4.0) == 4.0
+    # 0.1 * 3 is 0.30000000000000004 in binary floating point
+    assert CVSSCalculator.round_up(0.1 * 3) == 0.3
+
+
+def test_repeated_metric_last_wins(calculator):
+    vector = "CVSS:3.1/AV:P/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H/AV:N"
+    assert calculator.calculate_score(vector)['base_score'] == 9.8
+
+
+def test_missing_metric_reports_error(calculator):
+    result = calculator.calculate_score("CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H")
+    assert 'error' in result
+
+
+@pytest.mark.parametrize("suffix", ["/garbage", "/AV/N:X:Y", "/E:XX", "\n"])
+def test_malformed_metric_reports_error(calculator, suffix):
+    vector = "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H" + suffix
+    assert 'error' in calculator.calculate_score(vector)
+    with pytest.raises(ValueError):
+        score_vector(vector)
+
+
+@pytest.mark.parametrize("suffix, valid", [
+    ("", True),
+    ("/", True),
+    ("/E:P/RL:O/RC:C", True),
+    ("/CR:H/IR:M/AR:L/MAV:N/MAC:H/MPR:L/MUI:R/MS:C/MC:N/MI:L/MA:X", True),
+    ("\n", False),
+    ("/AV:Q", False),
+    ("/MAV:Q", False),
+])
+def test_validate_vector_string(calculator, suffix, valid):
+    vector = "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H" + suffix
+    assert calculator.validate_vector_string(vector) is valid
+
+
+def test_calculate_many_matches_calculate_score(calculator):
+    np = pytest.importorskip("numpy")
+    vectors = [vector for vector, _, _ in BASE_VECTORS] + [vector for vector, _ in TEMPORAL_VECTORS]
+    expected = [calculator.calculate_score(vector)['base_score'] for vector in vectors]
+    np.testing.assert_array_equal(CVSSCalculator.calculate_many(vectors), expected)
+
+
+def test_calculate_many_rejects_invalid_values():
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        CVSSCalculator.calculate_many(["CVSS:3.1/AV:Z/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H"])
@@ -0,0 +1,104 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+spacy = pytest.importorskip("spacy")
+
+import vector_generator
+from vector_generator import VectorGenerator
+
+
+@pytest.fixture
+def generator():
+    # The spaCy model is only loaded on first use, so these tests never load it
+    return VectorGenerator()
+
+
+@pytest.fixture
+def blank_nlp(monkeypatch):
+    """Blank English pipeline with a tiny vector table, shared as the loaded model"""
+    nlp = spacy.blank("en")
+    for word, vector in [("remote", [1, 0, 0]), ("internet", [1, 0, 0]), ("crash", [0, 1, 0])]:
+        nlp.vocab.set_vector(word, np.array(vector, dtype=np.float32))
+    monkeypatch.setattr(vector_generator, "_SHARED_NLP", nlp)
+    return nlp
+
+
+def metrics_of(vector):
+    return dict(token.split(':') for token in vector.split('/')[1:])
+
+
+def test_no_evidence_uses_defaults(generator):
+    metrics = generator.determine_final_metrics(np.zeros(generator.score_shape))
+    assert metrics == {metric: rules['default'] for metric, rules in generator.metric_rules.items()}
+
+
+def test_highest_score_wins(generator):
+    scores = np.zeros(generator.score_shape)
+    av = generator.metric_order.index('AV')
+    scores[av, generator.metric_values[av].index('P')] = 2
+    scores[av, generator.metric_values[av].index('L')] = 1
+    assert generator.determine_final_metrics(scores)['AV'] == 'P'
+
+
+def test_create_vector_string(generator):
+    metrics = generator.determine_final_metrics(np.zeros(generator.score_shape))
+    assert generator.create_vector_string(metrics) == "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:L/I:L/A:L"
+
+
+def test_keywords_match_whole_tokens(blank_nlp, generator):
+    assert metrics_of(generator.generate_vector("attacker on the lan"))['AV'] == 'A'
+    # "lan" inside "plan" is not a match, so Attack Vector keeps its default
+    assert metrics_of(generator.generate_vector("attack plan"))['AV'] == 'N'
+
+
+def test_generate_vectors_blank_and_non_text(blank_nlp, generator):
+    vectors = list(generator.generate_vectors(["", None, 42, "remote crash"]))
+    assert vectors[:3] == [None, None, None]
+    assert vectors[3] == generator.generate_vector("remote crash")
+
+
+def test_generate_vectors_pipes_duplicates_once(blank_nlp, generator, monkeypatch):
+    piped = []
+    pipe = blank_nlp.pipe
+
+    def recording_pipe(texts, **kwargs):
+        texts = list(texts)
+        piped.extend(texts)
+        return pipe(texts, **kwargs)
+
+    monkeypatch.setattr(blank_nlp, "pipe", recording_pipe)
+    vectors = list(generator.generate_vectors(["Remote crash", "admin root", "remote crash", "Admin Root"]))
+    assert piped == ["remote crash", "admin root"]
+    assert vectors[0] == vectors[2] and vectors[1] == vectors[3]
+
+
+def test_generate_vectors_with_interleaved_generate_vector(blank_nlp, generator):
+    texts = ["new one a remote", "another physical device", "admin root"]
+    expected = [VectorGenerator().generate_vector(text) for text in texts]
+
+    vectors = generator.generate_vectors(texts)
+    results = [next(vectors)]
+    # Fills a key the suspended generator has not reached yet
+    generator.generate_vector("another physical device")
+    results.extend(vectors)
+
+    assert results == expected
+    assert [generator.generate_vector(text) for text in texts] == expected
+
+
+def test_generate_vectors_failing_row_yields_none(blank_nlp, generator, monkeypatch):
+    analyze_doc = generator.analyze_doc
+
+    def failing_analyze_doc(doc):
+        if "boom" in doc.text:
+            raise RuntimeError("analysis failed")
+        return analyze_doc(doc)
+
+    monkeypatch.setattr(generator, "analyze_doc", failing_analyze_doc)
+    texts = ["remote crash", "boom", "admin root", "Boom", "physical device"]
+    vectors = list(generator.generate_vectors(texts))
+
+    assert vectors[1] is None and vectors[3] is None
+    assert vectors[0] == VectorGenerator().generate_vector("remote crash")
+    assert vectors[2] == VectorGenerator().generate_vector("admin root")
+    assert vectors[4] == VectorGenerator().generate_vector("physical device")
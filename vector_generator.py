@@ -1,16 +1,37 @@
 import spacy
+import hashlib
+import numpy as np
 from collections import defaultdict
 import logging
+from spacy.matcher import PhraseMatcher
 
-class VectorGenerator:
-    def __init__(self):
-        # Load NLP model
+# spaCy components VectorGenerator never reads. Scoring only needs the tokenizer,
+# the lexical is_alpha/is_stop flags and the static word vectors, none of which
+# come from a pipeline component, so the whole trained pipeline is excluded and
+# its weights are never read from disk
+_UNUSED_PIPES = ["tok2vec", "tagger", "parser", "senter", "attribute_ruler", "lemmatizer", "ner"]
+
+_SHARED_NLP = None
+
+def get_nlp():
+    """Load the spaCy model once per process; every VectorGenerator shares it"""
+    global _SHARED_NLP
+    if _SHARED_NLP is None:
+        # Calling this in a parent process before forking lets the workers share
+        # the model's memory copy-on-write instead of each loading their own
         try:
-            self.nlp = spacy.load("en_core_web_md")
+            _SHARED_NLP = spacy.load("en_core_web_md", exclude=_UNUSED_PIPES)
         except OSError:
             logging.info("Downloading spaCy model...")
             spacy.cli.download("en_core_web_md")
-            self.nlp = spacy.load("en_core_web_md")
+            _SHARED_NLP = spacy.load("en_core_web_md", exclude=_UNUSED_PIPES)
+    return _SHARED_NLP
+
+class VectorGenerator:
+    def __init__(self):
+        # NLP model, keyword vectors and matcher are loaded on first use, see the properties below
+        self._keyword_vectors = None
+        self._keyword_matcher = None
 
         # CVSS metric rules
         self.metric_rules = {
@@ -78,14 +99,130 @@ class VectorGenerator:
             }
         }
 
+        # Scores are kept in a (metric, value) array; shorter value lists leave
+        # trailing zero cells, which never win argmax over the real values
+        self.metric_order = list(self.metric_rules)
+        self.metric_values = [list(rules['keywords']) for rules in self.metric_rules.values()]
+        self.score_shape = (len(self.metric_order), max(len(values) for values in self.metric_values))
+        self.default_values = np.array([
+            values.index(rules['default']) for rules, values in zip(self.metric_rules.values(), self.metric_values)
+        ])
+
+        # One row per keyword, tagged with the flat index of its (metric, value) cell
+        self.keywords = []
+        cell_of_row = []
+        for m, rules in enumerate(self.metric_rules.values()):
+            for v, value_keywords in enumerate(rules['keywords'].values()):
+                self.keywords.extend(value_keywords)
+                cell_of_row.extend([m * self.score_shape[1] + v] * len(value_keywords))
+        self.keyword_cell_index = np.array(cell_of_row)
+        self.keyword_rows = defaultdict(list)
+        for row, keyword in enumerate(self.keywords):
+            self.keyword_rows[keyword].append(row)
+
+        # Vector strings by digest of the lowercased description; repeated threats
+        # skip spaCy entirely, and long descriptions are not kept in memory
+        self.vector_cache = {}
+
+    @property
+    def nlp(self):
+        """spaCy model, loaded on first use; only tokens and their vectors are used"""
+        return get_nlp()
+
+    @property
+    def keyword_vectors(self):
+        """Unit-length keyword vectors, computed once on first use"""
+        if self._keyword_vectors is None:
+            # Only the tokenizer is needed, since a Doc's vector is the mean of its token vectors
+            self._keyword_vectors = self._unit_vectors(
+                [self.nlp.make_doc(keyword).vector for keyword in self.keywords]
+            )
+        return self._keyword_vectors
+
+    @property
+    def keyword_matcher(self):
+        """Phrase matcher with one rule per keyword, built once on first use"""
+        if self._keyword_matcher is None:
+            self._keyword_matcher = PhraseMatcher(self.nlp.vocab, attr="LOWER")
+            for keyword in self.keyword_rows:
+                self._keyword_matcher.add(keyword, [self.nlp.make_doc(keyword)])
+        return self._keyword_matcher
+
     def generate_vector(self, threat_desc):
         """Generate CVSS vector string from threat description"""
         if not threat_desc or not isinstance(threat_desc, str):
             return None
 
-        # Process text with spaCy
-        doc = self.nlp(threat_desc.lower())
-        
+        # Already-lowercase text is used as is instead of being copied
+        text = threat_desc if threat_desc.islower() else threat_desc.lower()
+        key = self.cache_key(text)
+        if key not in self.vector_cache:
+            # Process text with spaCy
+            self.vector_cache[key] = self.analyze_doc(self.nlp(text))
+        return self.vector_cache[key]
+
+    def generate_vectors(self, threat_descs, batch_size=128, n_process=1):
+        """Generate CVSS vector strings for many threat descriptions, batching the spaCy pipeline"""
+        # Blank or non-text descriptions get None, matching generate_vector
+        texts = [
+            (desc if desc.islower() else desc.lower()) if desc and isinstance(desc, str) else None
+            for desc in threat_descs
+        ]
+        keys = [self.cache_key(text) if text is not None else None for text in texts]
+
+        # Each description not seen before is processed once, in first-seen order
+        pending = {}
+        for key, text in zip(keys, texts):
+            if key is not None and key not in self.vector_cache:
+                pending.setdefault(key, text)
+        docs = self._pipe_pending(pending, batch_size, n_process)
+
+        failed = set()
+        for key, text in zip(keys, texts):
+            if key is None or key in failed:
+                yield None
+                continue
+            try:
+                # generate_vector may fill keys while this generator is suspended, so docs
+                # are filed under their own keys until this one is present
+                while key not in self.vector_cache:
+                    doc_key, doc_text, doc = next(docs)
+                    if doc_key not in self.vector_cache:
+                        if doc is None:
+                            doc = self.nlp(doc_text)
+                        self.vector_cache[doc_key] = self.analyze_doc(doc)
+            except Exception as e:
+                # A failing description gets None, like blank input, and the batch goes on
+                logging.error("Error generating vector for '%s': %s", text[:100], e)
+                failed.add(key)
+                yield None
+                continue
+            yield self.vector_cache[key]
+
+    def _pipe_pending(self, pending, batch_size, n_process):
+        """Yield (key, text, Doc) for each pending description, in order; Doc is None for
+        descriptions left unparsed after the batched pipeline fails"""
+        items = list(pending.items())
+        parsed = 0
+        try:
+            # n_process > 1 spreads the batches over worker processes
+            for doc in self.nlp.pipe([text for _, text in items], batch_size=batch_size, n_process=n_process):
+                key, text = items[parsed]
+                parsed += 1
+                yield key, text, doc
+        except Exception as e:
+            # The pipe cannot be resumed, so the rest are parsed one by one by the caller
+            logging.error("Batched spaCy processing failed, parsing descriptions one by one: %s", e)
+        for key, text in items[parsed:]:
+            yield key, text, None
+
+    @staticmethod
+    def cache_key(text):
+        """Fixed-size key for a lowercased description"""
+        return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+    def analyze_doc(self, doc):
+        """Generate CVSS vector string from a processed threat description"""
         # Score each metric
         metric_scores = self.score_metrics(doc)
         
@@ -96,46 +233,57 @@ class VectorGenerator:
         return self.create_vector_string(final_metrics)
 
     def score_metrics(self, doc):
-        """Score each metric based on threat description"""
-        metric_scores = defaultdict(lambda: defaultdict(float))
-        
-        for metric, rules in self.metric_rules.items():
-            for value, keywords in rules['keywords'].items():
-                score = 0
-                for keyword in keywords:
-                    # Direct keyword matching
-                    if keyword in doc.text:
-                        score += 1
-                    
-                    # Semantic similarity
-                    keyword_doc = self.nlp(keyword)
-                    for chunk in doc.noun_chunks:
-                        similarity = keyword_doc.similarity(chunk)
-                        if similarity > 0.7:
-                            score += similarity
-                
-                metric_scores[metric][value] = score
-        
-        return metric_scores
+        """Score each metric value based on threat description, as a (metric, value) array"""
+        cells = self.score_shape[0] * self.score_shape[1]
+
+        # Direct keyword matching: one point per keyword found as whole tokens, so
+        # "lan" no longer matches inside "plan" or "authenticated" inside "unauthenticated"
+        strings = self.nlp.vocab.strings
+        matched = {strings[match_id] for match_id, _, _ in self.keyword_matcher(doc)}
+        matched_rows = [row for keyword in matched for row in self.keyword_rows[keyword]]
+        keyword_scores = np.bincount(self.keyword_cell_index[matched_rows], minlength=cells)
+
+        # Semantic similarity: cosine of every keyword against every content word; words
+        # without a vector can only score through an identical keyword, so the rest are dropped
+        words = [
+            token for token in doc
+            if token.is_alpha and not token.is_stop and (token.has_vector or token.text in self.keyword_rows)
+        ]
+        if not words:
+            # Short or out-of-vocabulary text: skip the similarity pass entirely
+            return keyword_scores.reshape(self.score_shape).astype(float)
+        similarities = self.keyword_vectors @ self._unit_vectors([token.vector for token in words]).T
+        for column, token in enumerate(words):
+            # spaCy scores identical text as 1.0, even without vectors
+            if token.text in self.keyword_rows:
+                similarities[self.keyword_rows[token.text], column] = 1.0
+        similarities[similarities <= 0.7] = 0
+        similarity_scores = np.bincount(self.keyword_cell_index, weights=similarities.sum(axis=1), minlength=cells)
+
+        return (keyword_scores + similarity_scores).reshape(self.score_shape)
+
+    def _unit_vectors(self, vectors):
+        """Stack vectors into a matrix of unit-length rows"""
+        matrix = np.array(vectors, dtype=np.float32).reshape(len(vectors), self.nlp.vocab.vectors_length)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        # Empty vectors keep a zero similarity, as in spaCy
+        norms[norms == 0] = 1
+        return matrix / norms
 
     def determine_final_metrics(self, metric_scores):
         """Determine final metrics based on scores"""
-        final_metrics = {}
-        for metric, scores in metric_scores.items():
-            if scores:
-                max_score_value = max(scores.items(), key=lambda x: x[1])[0]
-                final_metrics[metric] = max_score_value
-            else:
-                final_metrics[metric] = self.metric_rules[metric]['default']
-        
-        return final_metrics
+        # argmax keeps the first value on ties, like max() over the value order;
+        # metrics with no evidence at all fall back to their declared default
+        best = np.where(metric_scores.any(axis=1), metric_scores.argmax(axis=1), self.default_values)
+        return {
+            metric: values[index]
+            for metric, values, index in zip(self.metric_order, self.metric_values, best)
+        }
 
     def create_vector_string(self, metrics):
         """Create CVSS v3.1 vector string"""
-        vector_parts = [
-            f"AV:{metrics['AV']}", f"AC:{metrics['AC']}", 
-            f"PR:{metrics['PR']}", f"UI:{metrics['UI']}", 
-            f"S:{metrics['S']}", f"C:{metrics['C']}", 
-            f"I:{metrics['I']}", f"A:{metrics['A']}"
-        ]
-        return "CVSS:3.1/" + '/'.join(vector_parts)
\ No newline at end of file
+        m = metrics
+        return (
+            f"CVSS:3.1/AV:{m['AV']}/AC:{m['AC']}/PR:{m['PR']}/UI:{m['UI']}"
+            f"/S:{m['S']}/C:{m['C']}/I:{m['I']}/A:{m['A']}"
+        )
\ No newline at end of file